@@ -1,6 +1,27 @@
+import threading
+from array import array
 import tkinter as tk
-from tkinter import colorchooser, filedialog, messagebox, simpledialog
-from PIL import Image, ImageDraw, ImageTk, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageTk
+
+_ICON_NAMES = ('clear', 'colour', 'save', 'brush', 'rubber', 'resize', 'text', 'background')
+_ICONS = {}
+_HEX = [f'{i:02x}' for i in range(256)]
+
+
+def _load_icons(root):
+	"""
+	Loads the toolbar icons from the `images` folder once per Tk root and returns them
+	as a dict keyed by icon name. Later calls with the same root return the loaded icons.
+
+	Args:
+		root (tk.Tk): The Tkinter window the icons belong to.
+	"""
+	icons = _ICONS.get(root)
+	if icons is None:
+		icons = _ICONS[root] = {
+			name: tk.PhotoImage(master=root, file=f'images/{name}.png') for name in _ICON_NAMES
+		}
+	return icons
 
 
 class DrawingApp:
@@ -11,19 +32,21 @@ class DrawingApp:
 		selected_brush_size (tk.StringVar): Variable to store selected brush size.
 		root (tk.Tk): Root window of the tkinter application.
 		image (PIL.Image): Image object for drawing and saving as a PNG.
-		draw (PIL.ImageDraw.Draw): Draw object for drawing on the image.
 		canvas (tk.Canvas): Canvas widget for drawing shapes.
 		last_x, last_y (int or None): Coordinates of the last mouse position for drawing lines.
 		pen_color (str): Current color of the pen/brush.
 		last_color (str): Last used color of the pen, stored when switching to rubber.
+		_FONT_CACHE (dict): Fonts loaded by `add_text`, keyed by size.
 	"""
 
+	_FONT_CACHE = {}
+
 	def __init__(self, root):
 		"""
 		Initializes the DrawingApp with a Tkinter root, canvas, image, and UI controls.
 
 		This constructor method sets up the main components of the drawing application, including:
-		- An RGBA image for storing drawings, which allows transparency.
+		- An RGB image for storing drawings.
 		- A drawing canvas for user interactions.
 		- Controls and tools, such as color selection, brush, rubber, and text buttons.
 		- Event bindings for interactive functionality, like drawing and erasing.
@@ -33,20 +56,35 @@ class DrawingApp:
 
 		Attributes:
 			selected_brush_size (tk.StringVar): Tracks the size of the selected brush.
+			_brush_width (int): Selected brush size as an integer, updated when the size changes.
+			_min_step_sq (int): Squared minimal distance between two accepted stroke points.
+			_capstyle (str): Cap style passed to `canvas.create_line`.
 			root (tk.Tk): Reference to the main application window.
+			_icons (dict): Toolbar icons loaded by `_load_icons`, keyed by name.
 			width (int): Width of the drawing canvas.
 			height (int): Height of the drawing canvas.
 			bg_colour (str): Default background color of the canvas.
-			image (PIL.Image.Image): The RGBA image where drawings are stored.
-			draw (PIL.ImageDraw.ImageDraw): Object for drawing on `self.image`.
+			image (PIL.Image.Image): The RGB image where drawings are stored.
+			_px (PIL.Image.core.PixelAccess): Pixel access object of `self.image`, used by the pipette.
 			last_x, last_y (int, int): Last known coordinates for drawing actions.
+			_stroke_pts (list): Flat x, y coordinates of the current stroke that are not drawn yet.
+			_flush_id (str or None): Id of the scheduled `_flush_stroke` call, if any.
+			_active_stroke_id (int or None): Id of the canvas line showing the current stroke.
+			_all_pts (array.array): Flat coordinates of the current stroke shown by `_active_stroke_id`.
+			_ops (list): Strokes shown on the canvas but not yet rendered into `self.image`,
+				as `(points, rgb, width)` tuples.
+			_stroke_op (tuple or None): Entry of `_ops` the current stroke is appended to.
+			tk_image (PIL.ImageTk.PhotoImage or None): Photo image showing `self.image` on the canvas.
+			_canvas_img_id (int or None): Id of the canvas item that displays `tk_image`.
 			pen_color (str): Current color of the drawing tool.
+			_pen_rgb (tuple): `pen_color` parsed into an (r, g, b) tuple for drawing on the image.
 			last_color (str): Stores the previous pen color, used for switching tools.
 			control_frame (tk.Frame): Frame containing UI controls.
 			mode (str): Current mode of the application, e.g., 'draw'.
 			color_button (tk.Button): Button to choose drawing color.
 			brush_button (tk.Button): Button to activate the brush tool.
 			rubber_button (tk.Button): Button to activate the eraser tool.
+			_rubber_enabled (bool): Whether the rubber button was enabled by the first stroke.
 			text_button (tk.Button): Button to add text to the canvas.
 			label (tk.Label): Label displaying the current pen color.
 			canvas (tk.Canvas): Canvas widget for displaying and interacting with the image.
@@ -57,29 +95,44 @@ class DrawingApp:
 
 		"""
 		self.selected_brush_size = tk.StringVar()
+		self._brush_width = 1
+		self._min_step_sq = 4
+		self._capstyle = tk.ROUND
+		self.selected_brush_size.trace_add('write', self._on_brush_size)
 		self.root = root
 		self.root.title('Рисовалка с сохранением в PNG')
+		self._icons = _load_icons(root)
 
 		self.width = 600
 		self.height = 400
 		self.bg_colour = 'white'
-		self.image = Image.new("RGBA", (self.width, self.height), (255, 255, 255, 255))
-		self.draw = ImageDraw.Draw(self.image)
+		self.image = Image.new("RGB", (self.width, self.height), 'white')
+		self._px = self.image.load()
 
 		self.last_x, self.last_y = None, None
+		self._stroke_pts = []
+		self._flush_id = None
+		self._active_stroke_id = None
+		self._all_pts = array('i')
+		self._ops = []
+		self._stroke_op = None
+		self.tk_image = None
+		self._canvas_img_id = None
 		self.pen_color, self.last_color = 'black', 'black'
+		self._pen_rgb = (0, 0, 0)
 		self.control_frame = tk.Frame(self.root)
 		self.mode = 'draw'
 
 		self.color_button = tk.Button(self.control_frame, command=lambda: self.choose_color(None))
 		self.brush_button = tk.Button(self.control_frame, command=self.brush)
 		self.rubber_button = tk.Button(self.control_frame, command=self.rubber)
+		self._rubber_enabled = False
 		self.text_button = tk.Button(self.control_frame, command=self.add_text)
 		self.label = tk.Label(self.control_frame, bg=self.pen_color)
 
 		self.setup_ui()
 
-		self.canvas = tk.Canvas(root, width=600, height=400, bg='white')
+		self.canvas = tk.Canvas(root, width=600, height=400, bg='white', cursor='@cursor.cur')
 		self.canvas.pack()
 
 		self.binds()
@@ -92,27 +145,19 @@ class DrawingApp:
 		"""
 		self.control_frame.pack(fill=tk.X)
 
-		clear_icon = tk.PhotoImage(file="images/clear.png")
-		clear_button = tk.Button(self.control_frame, image=clear_icon, command=self.clear_canvas)
-		clear_button.image = clear_icon
+		clear_button = tk.Button(self.control_frame, image=self._icons['clear'], command=self.clear_canvas)
 		clear_button.pack(side=tk.LEFT)
 		self.add_tooltip(clear_button, "Очистить")
 
-		color_icon = tk.PhotoImage(file="images/colour.png")
-		self.color_button.config(image=color_icon)
-		self.color_button.image = color_icon
+		self.color_button.config(image=self._icons['colour'])
 		self.color_button.pack(side=tk.LEFT)
 		self.add_tooltip(self.color_button, 'Цвет кисти')
 
-		save_icon = tk.PhotoImage(file='images/save.png')
-		save_button = tk.Button(self.control_frame, image=save_icon, command=lambda: self.save_image(None))
-		save_button.image = save_icon
+		save_button = tk.Button(self.control_frame, image=self._icons['save'], command=lambda: self.save_image(None))
 		save_button.pack(side=tk.LEFT)
 		self.add_tooltip(save_button, 'Сохранить')
 
-		brush_icon = tk.PhotoImage(file='images/brush.png')
-		self.brush_button.config(image=brush_icon, relief='sunken')
-		self.brush_button.image = brush_icon
+		self.brush_button.config(image=self._icons['brush'], relief='sunken')
 		self.brush_button.pack(side=tk.LEFT)
 
 		# Brush sizes menu
@@ -124,27 +169,19 @@ class DrawingApp:
 		self.brush_button.bind('<Button-1>', lambda event: brush_menu.post(event.x_root, event.y_root))
 		self.add_tooltip(self.brush_button, 'Выбор размера кисти')
 
-		rubber_icon = tk.PhotoImage(file='images/rubber.png')
-		self.rubber_button.config(image=rubber_icon, state='disabled')
-		self.rubber_button.image = rubber_icon
+		self.rubber_button.config(image=self._icons['rubber'], state='disabled')
 		self.rubber_button.pack(side=tk.LEFT)
 		self.add_tooltip(self.rubber_button, 'Ластик')
 
-		resize_icon = tk.PhotoImage(file='images/resize.png')
-		resize_button = tk.Button(self.control_frame, image=resize_icon, command=self.choose_size)
-		resize_button.image = resize_icon
+		resize_button = tk.Button(self.control_frame, image=self._icons['resize'], command=self.choose_size)
 		resize_button.pack(side=tk.LEFT)
 		self.add_tooltip(resize_button, 'Размер холста')
 
-		text_icon = tk.PhotoImage(file='images/text.png')
-		self.text_button.config(image=text_icon)
-		self.text_button.image = text_icon
+		self.text_button.config(image=self._icons['text'])
 		self.text_button.pack(side=tk.LEFT)
 		self.add_tooltip(self.text_button, 'Текст')
 
-		background_icon = tk.PhotoImage(file='images/background.png')
-		background_button = tk.Button(self.control_frame, image=background_icon, command=self.background)
-		background_button.image = background_icon
+		background_button = tk.Button(self.control_frame, image=self._icons['background'], command=self.background)
 		background_button.pack(side=tk.LEFT)
 		self.add_tooltip(background_button, 'Фон')
 
@@ -165,64 +202,151 @@ class DrawingApp:
 		"""
 		    This method creates a `Toplevel` window that appears near the widget when
 		    the mouse cursor enters the widget's area, displaying the specified tooltip text.
-		    The tooltip window closes automatically when the mouse cursor leaves the widget area.
+		    The tooltip window is hidden automatically when the mouse cursor leaves the widget area.
+		    The window is created on first hover and then only shown and hidden again.
 
 		    Args:
 		        widget (tk.Widget): The widget to which the tooltip will be attached.
 		        text (str): The text to display within the tooltip window.
 
 		    Inside the method:
-		        - `show_tooltip(event)`: A function to create and display the tooltip near the widget.
-		        - `hide_tooltip(event)`: A function to destroy the tooltip when the mouse leaves the widget area.
+		        - `show_tooltip(event)`: A function to create (once) and display the tooltip near the widget.
+		        - `hide_tooltip(event)`: A function to hide the tooltip when the mouse leaves the widget area.
 		"""
 		tooltip = None
 
 		def show_tooltip(event):
 			nonlocal tooltip
-			if tooltip is not None:
-				return
 			x = widget.winfo_rootx() + 20
 			y = widget.winfo_rooty() + widget.winfo_height() + 5
-			tooltip = tk.Toplevel(widget)
-			tooltip.wm_overrideredirect(True)
+			if tooltip is None:
+				tooltip = tk.Toplevel(widget)
+				tooltip.wm_overrideredirect(True)
+				label = tk.Label(tooltip, text=text, background='white', relief='solid', borderwidth=1, padx=5, pady=3)
+				label.pack()
 			tooltip.wm_geometry(f"+{x}+{y}")
-			label = tk.Label(tooltip, text=text, background='white', relief='solid', borderwidth=1, padx=5, pady=3)
-			label.pack()
+			tooltip.deiconify()
 
 		def hide_tooltip(event):
-			nonlocal tooltip
-			if isinstance(tooltip, tk.Toplevel):
-				tooltip.destroy()
-				tooltip = None
+			if tooltip is not None:
+				tooltip.withdraw()
 		widget.bind('<Enter>', show_tooltip)
 		widget.bind('<Leave>', hide_tooltip)
 
 	def paint(self, event):
 		"""
-			Draws a line on the canvas and image from the last known mouse position to
-			the current mouse position. This function is bound to mouse movement events.
+			Records the current mouse position as a point of the stroke. This function is
+			bound to mouse movement events. Drawing itself is deferred to `_flush_stroke`,
+			which is scheduled once per idle cycle, so a burst of motion events results in
+			a single canvas update.
+
+			Movements shorter than a brush-size dependent threshold are ignored; the last
+			accepted point is kept, so the next accepted point still connects to it.
+			The cursor for the current mode is set once at the start of each stroke, which
+			also replaces the pipette cursor after a color pick.
 
 			Args:
 				event (tk.Event): The event object containing the current mouse position.
 		"""
-		self.rubber_button.config(state='normal')
-		if self.mode == 'draw':
-			self.canvas.config(cursor='@cursor.cur')
+		if not self._rubber_enabled:
+			self.rubber_button.config(state='normal')
+			self._rubber_enabled = True
+		x, y = event.x, event.y
+		last_x, last_y = self.last_x, self.last_y
+		if last_x is not None:
+			dx = x - last_x
+			dy = y - last_y
+			if dx * dx + dy * dy < self._min_step_sq:
+				return
+			self._stroke_pts.extend((x, y))
+			if self._flush_id is None:
+				self._flush_id = self.root.after_idle(self._flush_stroke)
 		else:
-			self.canvas.config(cursor='@eraser.cur')
-		if self.last_x and self.last_y:
-			self.canvas.create_line(
-				self.last_x, self.last_y, event.x, event.y,
-				width=int(self.selected_brush_size.get()), fill=self.pen_color,
-				capstyle=tk.ROUND, smooth=tk.TRUE
+			self._stroke_pts = [x, y]
+			self.canvas.config(cursor='@cursor.cur' if self.mode == 'draw' else '@eraser.cur')
+		self.last_x = x
+		self.last_y = y
+
+	def _flush_stroke(self):
+		"""
+			Draws the accumulated stroke points on the canvas and appends them to the stroke
+			queued for `_render`, so a whole stroke (a brush line or a rubber swipe) is one
+			canvas item and is rendered into the image with a single call. The last point is
+			kept so the next batch continues from it.
+		"""
+		self._flush_id = None
+		pts = self._stroke_pts
+		if len(pts) < 4:
+			return
+		width = self._brush_width
+		if self._active_stroke_id is None:
+			self._all_pts = array('i', pts)
+			self._active_stroke_id = self.canvas.create_line(
+				*pts, width=width, fill=self.pen_color,
+				capstyle=self._capstyle
 			)
-			self.draw.line(
-				[self.last_x, self.last_y, event.x, event.y],
-				fill=self.pen_color, width=int(self.selected_brush_size.get())
-				)
-		self.last_x = event.x
-		self.last_y = event.y
-		self.label.config(bg=self.pen_color)
+		else:
+			self._all_pts.extend(pts[2:])
+			self.canvas.coords(self._active_stroke_id, self._all_pts.tolist())
+		if self._stroke_op is None:
+			self._stroke_op = (pts[:], self._pen_rgb, width)
+			self._ops.append(self._stroke_op)
+		else:
+			self._stroke_op[0].extend(pts[2:])
+		self._stroke_pts = pts[-2:]
+
+	def _render(self):
+		"""
+			Renders the queued strokes into `self.image` in one pass. Strokes are only drawn
+			on the canvas while painting; the image is brought up to date right before
+			its pixels are needed (saving, adding text, picking a color).
+		"""
+		if not self._ops:
+			return
+		draw = ImageDraw.Draw(self.image)
+		for pts, color, width in self._ops:
+			draw.line(pts, fill=color, width=width, joint='curve')
+		self._ops = []
+		self._stroke_op = None
+
+	def _show_image(self):
+		"""
+			Displays `self.image` on the canvas above the strokes drawn so far. The photo
+			image and its canvas item are created once and then updated in place; the
+			photo image is only recreated when the image size changes.
+		"""
+		if self.tk_image is None or (self.tk_image.width(), self.tk_image.height()) != self.image.size:
+			self.tk_image = ImageTk.PhotoImage('RGB', self.image.size, master=self.root)
+		self.tk_image.paste(self.image)
+		if self._canvas_img_id is None:
+			self._canvas_img_id = self.canvas.create_image(0, 0, anchor="nw", image=self.tk_image)
+		else:
+			self.canvas.itemconfig(self._canvas_img_id, image=self.tk_image)
+			self.canvas.tag_raise(self._canvas_img_id)
+
+	def _on_brush_size(self, *args):
+		"""
+		    Caches the brush size as an integer together with the minimal stroke step derived
+		    from it, so `paint` does not read the `StringVar` on every motion event. Called
+		    whenever `self.selected_brush_size` is written.
+		"""
+		self._brush_width = int(self.selected_brush_size.get())
+		self._min_step_sq = max(2, self._brush_width // 2) ** 2
+
+	def _set_pen_color(self, color, rgb=None):
+		"""
+			Sets the pen color, parses it once into `self._pen_rgb` for drawing on the image
+			and shows it in the color label.
+
+			Args:
+				color (str): Color for the canvas, e.g. '#rrggbb' or a color name.
+				rgb (tuple or None): The same color as an (r, g, b) tuple, if already known.
+		"""
+		if rgb is None:
+			rgb = ImageColor.getrgb(color)
+		self.pen_color = color
+		self._pen_rgb = rgb
+		self.label.config(bg=color)
 
 	def brush(self):
 		"""
@@ -231,7 +355,7 @@ class DrawingApp:
 		    to indicate active brush tool and visually resets other tools' states.
 		"""
 		self.color_button.config(state='normal')
-		self.pen_color = self.last_color
+		self._set_pen_color(self.last_color)
 		self.canvas.config(cursor='@cursor.cur')
 		self.mode = 'draw'
 		self.rubber_button.config(relief='raised')
@@ -243,7 +367,7 @@ class DrawingApp:
 		"""
 
 		self.last_color = self.pen_color
-		self.pen_color = self.bg_colour
+		self._set_pen_color(self.bg_colour)
 		self.canvas.config(cursor='@eraser.cur')
 		self.mode = 'rubber'
 		self.brush_button.config(relief='raised')
@@ -257,8 +381,9 @@ class DrawingApp:
 		   Additionally, it updates the cursor to indicate the pipette tool and adjusts the
 		   button states to reflect the selected tool.
 		"""
-		rgb = self.image.getpixel((event.x, event.y))
-		self.pen_color = '#{:02x}{:02x}{:02x}'.format(*rgb)
+		self._render()
+		r, g, b = self._px[event.x, event.y]
+		self._set_pen_color('#' + _HEX[r] + _HEX[g] + _HEX[b], (r, g, b))
 		self.canvas.config(cursor='@pipette.cur')
 		self.mode = 'draw'
 		self.brush_button.config(relief='sunken')
@@ -266,22 +391,59 @@ class DrawingApp:
 
 	def reset(self, event):
 		"""
-			Resets the last known mouse position, ending the current line. This function
-			is called on mouse release events.
+			Draws the rest of the current line, including the release point that may have
+			been skipped by the distance filter, and resets the last known mouse position.
+			The finished line is disabled so Tk skips it when picking the item under the mouse.
+			This function is called on mouse release events.
 
 			Args:
 				event (tk.Event): The event object indicating the mouse release.
 		"""
+		if self.last_x is not None and (event.x, event.y) != (self.last_x, self.last_y):
+			self._stroke_pts.extend((event.x, event.y))
+		if self._flush_id is not None:
+			self.root.after_cancel(self._flush_id)
+		self._flush_stroke()
+		if self._active_stroke_id is not None:
+			self.canvas.itemconfigure(self._active_stroke_id, state='disabled')
+		self._stroke_pts = []
+		self._active_stroke_id = None
+		self._all_pts = array('i')
+		self._stroke_op = None
 		self.last_x, self.last_y = None, None
 
+	def _reset_image(self, size, color):
+		"""
+			Makes `self.image` a blank image of the given size filled with `color` and drops
+			the queued strokes. When the size does not change, the existing image is filled
+			in place, keeping its buffer and `self._px` valid.
+
+			Args:
+				size (tuple): Width and height of the image.
+				color (str): Fill color.
+		"""
+		if self.image.size == size:
+			self.image.paste(color, (0, 0, *size))
+		else:
+			self._set_image(Image.new('RGB', size, color))
+		self._ops = []
+		self._stroke_op = None
+
+	def _set_image(self, image):
+		"""
+			Replaces `self.image` and rebinds `self._px` to the new image.
+		"""
+		self.image = image
+		self._px = self.image.load()
+
 	def clear_canvas(self):
 		"""
 			Clears the canvas and resets the image to a blank white background.
 		"""
 		self.canvas.delete('all')
+		self._canvas_img_id = None
 		self.canvas.config(background='white')
-		self.image = Image.new('RGB', (self.width, self.height), 'white')
-		self.draw = ImageDraw.Draw(self.image)
+		self._reset_image((self.width, self.height), 'white')
 		self.bg_colour = 'white'
 		self.brush()
 
@@ -290,22 +452,32 @@ class DrawingApp:
 			Opens a color chooser dialog to let the user pick a new color for the pen.
 			Updates the pen color with the selected color.
 		"""
-		self.pen_color = colorchooser.askcolor(color=self.pen_color)[1]
-		self.last_color = self.pen_color
+		from tkinter import colorchooser
+		color = colorchooser.askcolor(color=self.pen_color)[1]
+		if color:
+			self._set_pen_color(color)
+			self.last_color = self.pen_color
 
 	def choose_size(self):
 		"""
-			Asks the user to set custom sizes of plot and creates a new canvas and image with the specified size.
+			Asks the user to set custom sizes of plot and resizes the canvas and image to the specified size.
+			The drawing is kept: queued strokes are rendered, the image is copied into a new
+			image of the new size filled with the background color, and the canvas is resized
+			in place and redrawn from that image so it matches what will be saved.
 		"""
-		self.width = tk.simpledialog.askinteger('','Ширина', parent=self.root)
-		self.height = tk.simpledialog.askinteger('' ,'Высота', parent=self.root)
-		if self.width is not None and self.height is not None:
-			self.image = self.image = Image.new('RGB', (self.width, self.height), 'white')
-			self.draw = ImageDraw.Draw(self.image)
-			self.canvas.destroy()
-			self.canvas = tk.Canvas(self.root, width=self.width, height=self.height, bg='white')
-			self.canvas.pack()
-			self.binds()
+		from tkinter import simpledialog
+		width = simpledialog.askinteger('','Ширина', parent=self.root)
+		height = simpledialog.askinteger('' ,'Высота', parent=self.root)
+		if width is not None and height is not None:
+			self.width, self.height = width, height
+			self._render()
+			image = Image.new('RGB', (width, height), self.bg_colour)
+			image.paste(self.image, (0, 0))
+			self._set_image(image)
+			self.canvas.config(width=width, height=height)
+			self.canvas.delete('all')
+			self._canvas_img_id = None
+			self._show_image()
 
 	def background(self):
 		"""
@@ -313,55 +485,98 @@ class DrawingApp:
 
 		    Attributes updated:
 		        - `self.bg_colour`: Stores the selected background color in hex format.
-		        - `self.image`: Recreates the image with the new background color.
-		        - `self.draw`: Updates the drawing object to use the new image.
+		        - `self.image`: Fills the image with the new background color.
 		        - `self.canvas`: Configures the canvas background and updates its image.
 
 		    """
-		self.bg_colour = colorchooser.askcolor(color=self.pen_color)[1]
-		if self.bg_colour:
-			bg_rgb = Image.new("RGB", (1, 1), self.bg_colour).getpixel((0, 0))
-			self.image = Image.new("RGBA", self.image.size, (*bg_rgb, 255))
-			self.draw = ImageDraw.Draw(self.image)
+		from tkinter import colorchooser
+		color = colorchooser.askcolor(color=self.pen_color)[1]
+		if color:
+			self.bg_colour = color
+			self._reset_image(self.image.size, self.bg_colour)
 			self.canvas.config(background=self.bg_colour)
-			self.tk_image = ImageTk.PhotoImage(self.image.convert("RGB"))
-			self.canvas.create_image(0, 0, anchor="nw", image=self.tk_image)
+			self._show_image()
 
 	def add_text(self):
 		"""
 		    Asks the user to enter text and its size, then places the text on the canvas at a specified location.
 
+		    The text is drawn straight into `self.image`, so only the pixels under the text
+		    are touched and no intermediate layer is allocated.
+
 		    Attributes updated:
-		        - `self.image`: Updates with the composited text layer to display on the canvas.
+		        - `self.image`: Updates with the drawn text to display on the canvas.
 		        - `self.tk_image`: Contains the updated image for display on the canvas.
 		        - `self.canvas`: Displays the modified image with the newly added text.
 
 		    """
+		from tkinter import simpledialog
 		text_str = simpledialog.askstring('Введите текст', '', parent=self.root)
 		text_size = simpledialog.askinteger('Размер текста', '', parent=self.root)
 		if text_str and text_size:
-			font = ImageFont.truetype('arial.ttf', text_size)
+			font = self._get_font(text_size)
 
 			def on_click(event):
-				text_layer = Image.new("RGBA", self.image.size, (255, 255, 255, 0))
-				text_img = ImageDraw.Draw(text_layer)
-				text_img.text((event.x, event.y), text_str, fill=self.pen_color, font=font)
-				self.image = Image.alpha_composite(self.image, text_layer)
-				self.tk_image = ImageTk.PhotoImage(self.image.convert("RGB"))
-				self.canvas.create_image(0, 0, anchor="nw", image=self.tk_image)
+				self._render()
+				ImageDraw.Draw(self.image).text((event.x, event.y), text_str, fill=self._pen_rgb, font=font)
+				self._show_image()
 				self.canvas.unbind("<Button-1>")
 			self.canvas.bind("<Button-1>", on_click)
 
+	def _get_font(self, size):
+		"""
+			Returns the text font of the given size, loading it from disk only the first time.
+		"""
+		from PIL import ImageFont
+		font = self._FONT_CACHE.get(size)
+		if font is None:
+			font = self._FONT_CACHE[size] = ImageFont.truetype('arial.ttf', size)
+		return font
+
 	def save_image(self, event):
 		"""
 		Opens a file dialog to save the current drawing as a PNG file. If a file
 		path is chosen, the image is saved, and a success message is displayed.
+
+		The PNG is written with the fastest deflate level: PNG is lossless at any level,
+		so only the file size changes slightly while encoding gets much faster.
+		Encoding runs on a background thread on a copy of the image, so the window
+		stays responsive while a large drawing is written. The Tk thread polls the
+		worker and shows the result once it has finished.
 		"""
+		from tkinter import filedialog
 		file_path = filedialog.asksaveasfilename(filetypes=[('PNG files', '*.png')])
 		if file_path:
 			if not file_path.endswith('.png'):
 				file_path += '.png'
-			self.image.save(file_path)
+			self._render()
+			result = {}
+			thread = threading.Thread(target=self._do_save, args=(self.image.copy(), file_path, result))
+			thread.start()
+			self._poll_save(thread, result)
+
+	@staticmethod
+	def _do_save(image, file_path, result):
+		"""
+		Encodes `image` as PNG into `file_path`. Runs on the worker thread, so it does not
+		touch Tk; a failure is stored in `result['error']` for `_poll_save`.
+		"""
+		try:
+			image.save(file_path, format='PNG', compress_level=1, optimize=False)
+		except OSError as error:
+			result['error'] = error
+
+	def _poll_save(self, thread, result):
+		"""
+		Waits on the Tk thread for the save worker to finish, then shows whether the image was saved.
+		"""
+		if thread.is_alive():
+			self.root.after(50, self._poll_save, thread, result)
+			return
+		from tkinter import messagebox
+		if 'error' in result:
+			messagebox.showerror('Ошибка', f"Не удалось сохранить изображение: {result['error']}")
+		else:
 			messagebox.showinfo('Информация', 'Изображение успешно сохранено!')
 
 
@@ -370,6 +585,7 @@ def main():
 	Main function to initialize and run the drawing application.
 	"""
 	root = tk.Tk()
+	_load_icons(root)
 	app = DrawingApp(root)
 	root.mainloop()
 